@@ -5,6 +5,8 @@
 from paper_rock_scissors import parser
 from paper_rock_scissors import GameEnvironment
 from paper_rock_scissors import Computer, Player
+from paper_rock_scissors import AdaptiveComputer, OpponentModelStore
+from paper_rock_scissors import Coordinator, Worker
 
 
 args = parser.parse_args()
@@ -14,11 +16,43 @@ def main():
     pass
 
 
-if __name__ == '__main__':
+if __name__ == '__main__' and args.mode == 'coordinator':
+
+    # Coordinator warns and falls back to 0 on a non integer seed
+    try:
+        seed = int(args.seed) if args.seed else 0
+    except ValueError:
+        seed = args.seed
+
+    coordinator = Coordinator(n_matches=args.matches,
+                              seed=seed,
+                              batch_size=args.batch_size,
+                              target_score=args.target_score,
+                              max_rounds=args.max_rounds,
+                              host=args.host,
+                              port=args.port)
+    results = coordinator.run()
+
+    wins = sum(result['winner'] == 'Player' for result in results)
+    print(f"{args.player_name} won {wins} of {len(results)} matches")
+
+elif __name__ == '__main__' and args.mode == 'worker':
+
+    n_batches = Worker(host=args.host, port=args.port).run()
+    print(f"Played {n_batches} batches")
+
+elif __name__ == '__main__':
 
     player = Player(name=args.player_name)
-    computer = Computer(name=args.computer_name,
-                        seed=args.seed)
+    store = OpponentModelStore(args.model_store) \
+        if args.model_store else None
+    if store is not None:
+        computer = AdaptiveComputer(name=args.computer_name,
+                                    seed=args.seed,
+                                    store=store)
+    else:
+        computer = Computer(name=args.computer_name,
+                            seed=args.seed)
 
     GameEnvironment = GameEnvironment(player,
                   computer,
@@ -27,6 +61,10 @@ if __name__ == '__main__':
                   sleep=args.sleep,
                   verbose=args.verbose)
 
-    GameEnvironment.play()
+    try:
+        GameEnvironment.play()
+    finally:
+        if store is not None:
+            store.close()
 
     print("Thank you for playing!")
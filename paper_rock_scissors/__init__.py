@@ -5,9 +5,19 @@ game Paper-Rock-Scissors.
 
 from ._base import GameEnvironment, MoveChoice, Outcome
 
+from ._clock import SystemClock, VirtualClock, AsyncVirtualClock
+
+from ._distributed import Coordinator, Worker, run_local
+
+from ._model import OpponentModel, OpponentModelStore
+
 from ._parser import parser
 
 from ._role import Computer
+from ._role import AdaptiveComputer
 from ._role import Player
 
-__all__ = ["GameEnvironment", "Computer", "Player", "parser", "MoveChoice", "Outcome"]
+__all__ = ["GameEnvironment", "Computer", "Player", "parser", "MoveChoice", "Outcome",
+           "SystemClock", "VirtualClock", "AsyncVirtualClock",
+           "Coordinator", "Worker", "run_local",
+           "AdaptiveComputer", "OpponentModel", "OpponentModelStore"]
@@ -5,9 +5,10 @@
 
 from abc import ABCMeta, abstractmethod
 from enum import Enum, auto
-import time
 import warnings
 
+from ._clock import BaseClock, SystemClock
+
 
 class MoveChoice(Enum):
     ROCK = auto()
@@ -69,6 +70,18 @@ class BaseRole(metaclass=ABCMeta):
         """Generate current move."""
         pass
 
+    def start_game(self, opponent):
+        """Called once before the first round against ``opponent``."""
+        pass
+
+    def observe(self, move):
+        """Called after each round with the opponent's move."""
+        pass
+
+    def end_game(self):
+        """Called once after the winner is decided."""
+        pass
+
 
 class GameEnvironment(ListInstanceMixin):
     """GameEnvironment class for paper_rock_scissors.
@@ -97,6 +110,11 @@ class GameEnvironment(ListInstanceMixin):
     _sleep : int, default=1
         Sleep time between each rounds.
 
+    _clock : _clock.BaseClock, default=None
+        Clock used to sleep between each rounds. If None, a
+        _clock.SystemClock is used. Pass a _clock.VirtualClock to
+        run the game without waiting for real time to pass.
+
     _verbose : int, default=0
         Verbosity level.
 
@@ -119,7 +137,8 @@ class GameEnvironment(ListInstanceMixin):
             max_rounds=20,
             sleep=1,
             verbose=0,
-            winner=None):
+            winner=None,
+            clock=None):
         self._player = player
         self._computer = computer
         self._target_score = target_score
@@ -128,6 +147,7 @@ class GameEnvironment(ListInstanceMixin):
         self._sleep = sleep
         self._verbose = verbose
         self._winner = winner
+        self._clock = SystemClock() if clock is None else clock
 
     @property
     def player(self):
@@ -177,6 +197,14 @@ class GameEnvironment(ListInstanceMixin):
     def sleep(self, value):
         self._sleep = value
 
+    @property
+    def clock(self):
+        return self._clock
+
+    @clock.setter
+    def clock(self, value):
+        self._clock = value
+
     @property
     def verbose(self):
         return self._verbose
@@ -217,6 +245,16 @@ class GameEnvironment(ListInstanceMixin):
             # Default sleep set to 1
             self._sleep = 1
 
+        # clock
+        if not isinstance(self._clock, BaseClock):
+            warnings.warn(
+                "clock must be an instance of BaseClock; "
+                f"got {self._clock} instead.",
+                RuntimeWarning,
+            )
+            # Default clock set to SystemClock
+            self._clock = SystemClock()
+
         # verbose
         if not isinstance(self._verbose, int) or \
             self._verbose < 0 or self._verbose > 3:
@@ -289,7 +327,58 @@ class GameEnvironment(ListInstanceMixin):
         else:
             return Outcome.LOSE
 
-    def play(self):
+    def _play_round(self, move, ai_move):
+        """Score one round and decide whether the game has a winner.
+
+        Parameters
+        ----------
+        move : MoveChoice
+            Player's move for current round.
+
+        ai_move : MoveChoice
+            AI's move for current round.
+        """
+        outcome = GameEnvironment._outcome(move, ai_move)
+
+        if outcome is Outcome.WIN:
+            if self.verbose >= 1:
+                print("Winner of the current round is: %s \n"
+                      % self.player.name)
+            self.player.score += 1
+        elif outcome is Outcome.LOSE:
+            if self.verbose >= 1:
+                print("Winner of the current round is: %s \n"
+                      % self.computer.name)
+            self.computer.score += 1
+        else:
+            if self.verbose >= 1:
+                print("It's a draw for this round")
+        self.curr_round += 1
+
+        self.player.observe(ai_move)
+        self.computer.observe(move)
+
+        if self.player.score == self.target_score:
+            self.winner = self.player
+        elif self.computer.score == self.target_score:
+            self.winner = self.computer
+
+    def _decide_winner(self):
+        """Decide the winner once the game is over."""
+        # Whoever has the highest score is the winner
+        # if there is not winner decided
+        # If draw then computer wins
+        if not self.winner:
+            self.winner = self.player if \
+                self.player.score > self.computer.score else self.computer
+
+    def _end_game(self):
+        """Notify roles the game ended, even if it was interrupted."""
+        self.player.end_game()
+        self.computer.end_game()
+
+    def _start_game(self):
+        """Validate parameters and notify roles the game starts."""
         # Validate roles input parameters
         self.player._check_params()
         self.computer._check_params()
@@ -297,62 +386,72 @@ class GameEnvironment(ListInstanceMixin):
         # Validate input parameters
         self._check_params()
 
-        # Display game rules
-        print(self._pprint_rules())
-        # Game ends while there is a winner or total rounds reach the maximum
-        while not self.winner and self.curr_round <= self.max_rounds:
-            # Print current game state
-            if self.verbose >= 1:
-                print(self._pprint_state())
+        self.player.start_game(self.computer)
+        self.computer.start_game(self.player)
 
-            # Prompt input from player
-            # Return MoveChoice
-            move = self.player.get_move("Choose a move for this round: ")
+    def simulate(self):
+        """Play the game headless, without rules, prompts or sleeps.
 
-            if self.verbose >= 1:
-                # Notify player's choice
-                print("%s's move: %s" % (self.player.name, move.name))
+        Both roles must be able to move without console input,
+        e.g. two _role.Computer instances.
 
-                # Computer's turn
-                print("\n%s is making a decision..." % self.computer.name)
-            time.sleep(self._sleep)
+        Returns
+        -------
+        winner : {_role.Player, _role.Computer}
+            Winner of the game.
+        """
+        self._start_game()
 
-            ai_move = self.computer.get_move("Choose a move for this round: ")
-            if self.verbose >= 1:
-                print("%s's move: %s" % (self.computer.name,
-                                         ai_move.name))
-                print("Current round is: %s vs %s" % (move.name,
-                                                      ai_move.name))
+        try:
+            while not self.winner and self.curr_round <= self.max_rounds:
+                move = self.player.get_move("Choose a move for this round: ")
+                ai_move = self.computer.get_move(
+                    "Choose a move for this round: ")
+                self._play_round(move, ai_move)
 
-            outcome = GameEnvironment._outcome(move, ai_move)
+            self._decide_winner()
+        finally:
+            self._end_game()
+        return self.winner
 
-            if outcome is Outcome.WIN:
+    def play(self):
+        self._start_game()
+
+        # Game ends early on ctrl + C, roles are notified regardless
+        try:
+            # Display game rules
+            print(self._pprint_rules())
+            # Game ends while there is a winner or total rounds reach the maximum
+            while not self.winner and self.curr_round <= self.max_rounds:
+                # Print current game state
                 if self.verbose >= 1:
-                    print("Winner of the current round is: %s \n"
-                          % self.player.name)
-                self.player.score += 1
-            elif outcome is Outcome.LOSE:
+                    print(self._pprint_state())
+
+                # Prompt input from player
+                # Return MoveChoice
+                move = self.player.get_move("Choose a move for this round: ")
+
                 if self.verbose >= 1:
-                    print("Winner of the current round is: %s \n"
-                          % self.computer.name)
-                self.computer.score += 1
-            else:
+                    # Notify player's choice
+                    print("%s's move: %s" % (self.player.name, move.name))
+
+                    # Computer's turn
+                    print("\n%s is making a decision..." % self.computer.name)
+                self._clock.sleep(self._sleep)
+
+                ai_move = self.computer.get_move("Choose a move for this round: ")
                 if self.verbose >= 1:
-                    print("It's a draw for this round")
-            self.curr_round += 1
+                    print("%s's move: %s" % (self.computer.name,
+                                             ai_move.name))
+                    print("Current round is: %s vs %s" % (move.name,
+                                                          ai_move.name))
 
-            if self.player.score == self.target_score:
-                self.winner = self.player
-            elif self.computer.score == self.target_score:
-                self.winner = self.computer
+                self._play_round(move, ai_move)
 
-        # Display final winner of the game
-        # Whoever has the highest score is the winner
-        # if there is not winner decided
-        # If draw then computer wins
-        if not self.winner:
-            self.winner = self.player if \
-                self.player.score > self.computer.score else self.computer
+            # Display final winner of the game
+            self._decide_winner()
+        finally:
+            self._end_game()
 
         print(f"Winner of the game: {self.winner.name}\n")
         print(self._pprint_state())
@@ -0,0 +1,142 @@
+"""Clock classes for paper rock scissors game
+"""
+
+# Author: Yehui He <yehui.he@hotmail.com>
+
+from abc import ABCMeta, abstractmethod
+import asyncio
+import heapq
+import itertools
+import time
+
+
+class BaseClock(metaclass=ABCMeta):
+    """Base class for clocks in paper_rock_scissors.
+
+    Warning: This class should not be used directly.
+    Use derived classes instead.
+    """
+
+    @abstractmethod
+    def time(self):
+        """Return current time in seconds."""
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds):
+        """Block for the given number of seconds."""
+        pass
+
+
+class SystemClock(BaseClock):
+    """Wall clock backed by the :mod:`time` module.
+
+    This is the default clock of the GameEnvironment.
+    """
+
+    def time(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+class VirtualClock(BaseClock):
+    """Virtual clock which advances time instantly.
+
+    Sleeping does not block. The simulated durations are recorded so
+    scripted games and tests can still inspect them.
+
+    Parameters
+    ----------
+    start : int or float, default=0
+        Initial time of the clock in seconds.
+
+    Attributes
+    ----------
+    now : int or float
+        Current simulated time in seconds.
+
+    durations : list
+        Simulated duration of every call to ``sleep``.
+    """
+
+    def __init__(self, start=0):
+        self.now = start
+        self.durations = []
+
+    @property
+    def elapsed(self):
+        """Total simulated time spent sleeping."""
+        return sum(self.durations)
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        if seconds < 0:
+            raise ValueError(f"sleep length must be non-negative, "
+                             f"got {seconds} instead.")
+        self.now += seconds
+        self.durations.append(seconds)
+
+
+class AsyncVirtualClock(VirtualClock):
+    """Virtual clock usable from coroutines.
+
+    Every ``asleep`` registers a deadline. Once no other callback of the
+    event loop is ready to run, i.e. every task is blocked, the waiter
+    with the earliest deadline is woken and the clock jumps to that
+    deadline, so concurrent sleeps overlap as they would in real time
+    without waiting for it to pass.
+
+    The ready callbacks are read from the ``_ready`` queue of asyncio's
+    own event loops. Other loops do not expose it; there a waiter is
+    woken as soon as the callbacks ready at that moment have run, so a
+    task which awaits something else before its next ``asleep`` may
+    register its deadline too late.
+
+    Parameters
+    ----------
+    start : int or float, default=0
+        Initial time of the clock in seconds.
+    """
+
+    def __init__(self, start=0):
+        super().__init__(start)
+        self._waiters = []
+        self._order = itertools.count()
+        self._dispatching = False
+
+    async def asleep(self, seconds):
+        """Suspend the current task until the clock reaches its deadline."""
+        if seconds < 0:
+            raise ValueError(f"sleep length must be non-negative, "
+                             f"got {seconds} instead.")
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        heapq.heappush(self._waiters,
+                       (self.now + seconds, next(self._order), waiter))
+        self.durations.append(seconds)
+        if not self._dispatching:
+            self._dispatching = True
+            loop.call_soon(self._dispatch, loop)
+        await waiter
+
+    def _dispatch(self, loop):
+        # Wait behind the ready callbacks until every task is blocked,
+        # so they all register their deadlines before the next one is woken
+        if getattr(loop, '_ready', None):
+            loop.call_soon(self._dispatch, loop)
+            return
+        while self._waiters:
+            deadline, _, waiter = heapq.heappop(self._waiters)
+            if waiter.cancelled():
+                continue
+            self.now = max(self.now, deadline)
+            waiter.set_result(None)
+            break
+        if self._waiters:
+            loop.call_soon(self._dispatch, loop)
+        else:
+            self._dispatching = False
@@ -0,0 +1,572 @@
+"""Distributed simulation of headless paper rock scissors matches
+"""
+
+# Author: Yehui He <yehui.he@hotmail.com>
+
+# Protocol
+# --------
+# Coordinator and workers exchange newline delimited JSON messages over
+# plain TCP. A worker sends ``hello`` once, then alternates ``request``
+# and ``result`` messages while a background thread sends ``heartbeat``
+# messages. The coordinator answers every ``request`` with ``batch``,
+# ``wait`` or ``done``.
+#
+# Every worker owns a queue of batch ids. Requests are served from the
+# worker's own queue first, then from the unassigned batches and finally
+# by stealing half of the longest queue of another worker. Batches held
+# by a worker which disconnects or misses its heartbeats are re-queued.
+
+from collections import deque
+import itertools
+import json
+import random
+import socket
+import threading
+import time
+import warnings
+
+from ._base import GameEnvironment, ListInstanceMixin
+from ._role import Computer
+
+
+def make_specs(n_matches, seed, target_score=10, max_rounds=20):
+    """Derive the match specifications from a master seed.
+
+    Parameters
+    ----------
+    n_matches : int
+        Number of matches.
+
+    seed : int
+        Master seed. The same seed always yields the same matches.
+
+    target_score : int, default=10
+        Target score of every match.
+
+    max_rounds : int, default=20
+        Maximum rounds of every match.
+
+    Returns
+    -------
+    specs : list of dict
+        One specification per match.
+    """
+    rng = random.Random(seed)
+    return [{'index': index,
+             'player_seed': rng.randrange(2 ** 32),
+             'computer_seed': rng.randrange(2 ** 32),
+             'target_score': target_score,
+             'max_rounds': max_rounds}
+            for index in range(n_matches)]
+
+
+def run_match(spec):
+    """Play one headless match between two seeded computers.
+
+    Parameters
+    ----------
+    spec : dict
+        Match specification, see :func:`make_specs`.
+
+    Returns
+    -------
+    result : dict
+        Final scores, rounds played and role of the winner.
+    """
+    player = Computer(name='player', role='Player', seed=spec['player_seed'])
+    computer = Computer(seed=spec['computer_seed'])
+    env = GameEnvironment(player,
+                          computer,
+                          target_score=spec['target_score'],
+                          max_rounds=spec['max_rounds'],
+                          sleep=0,
+                          verbose=0)
+    winner = env.simulate()
+    return {'index': spec['index'],
+            'winner': winner.role,
+            'player_score': player.score,
+            'computer_score': computer.score,
+            'rounds': env.curr_round}
+
+
+def run_local(n_matches, seed, target_score=10, max_rounds=20):
+    """Play the matches of a master seed in the current process.
+
+    Returns the same results as :class:`Coordinator` for the same
+    arguments.
+    """
+    return [run_match(spec)
+            for spec in make_specs(n_matches, seed, target_score, max_rounds)]
+
+
+def _send(sock, message):
+    sock.sendall(json.dumps(message).encode() + b'\n')
+
+
+# Fields and types of every message, by message type
+_MESSAGE_FIELDS = {
+    'hello': {},
+    'heartbeat': {},
+    'request': {},
+    'result': {'batch': int, 'results': list},
+    'batch': {'batch': int, 'specs': list},
+    'wait': {'delay': (int, float)},
+    'done': {},
+}
+
+_SPEC_FIELDS = ('index', 'player_seed', 'computer_seed',
+                'target_score', 'max_rounds')
+
+_RESULT_FIELDS = ('index', 'player_score', 'computer_score', 'rounds')
+
+_WINNERS = ('Player', 'Computer')
+
+
+def _recv(stream, kinds):
+    """Read the next message and check its shape.
+
+    Raises
+    ------
+    ConnectionError
+        If the peer closed the connection.
+
+    ValueError
+        If the message is not valid JSON, its type is not one of
+        ``kinds`` or its fields are missing or malformed.
+    """
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("connection closed by peer")
+    message = json.loads(line)
+    if not isinstance(message, dict) or message.get('type') not in kinds:
+        raise ValueError(f"unexpected message {message!r}.")
+    for field, kind in _MESSAGE_FIELDS[message['type']].items():
+        if not isinstance(message.get(field), kind) or \
+                isinstance(message[field], bool):
+            raise ValueError(f"message field {field} should be "
+                             f"{kind}, got {message.get(field)!r} instead.")
+    items = message.get('specs', message.get('results', []))
+    if not all(isinstance(item, dict) for item in items):
+        raise ValueError(f"malformed {message['type']} message.")
+    if message['type'] == 'batch' and not all(
+            isinstance(spec.get(field), int)
+            for spec in items for field in _SPEC_FIELDS):
+        raise ValueError("malformed batch message.")
+    return message
+
+
+class Coordinator(ListInstanceMixin):
+    """Coordinator distributing match batches to remote workers.
+
+    Parameters
+    ----------
+    n_matches : int, default=100
+        Number of matches to play.
+
+    seed : int, default=0
+        Master seed of the matches.
+
+    batch_size : int, default=10
+        Number of matches sent to a worker at once.
+
+    target_score : int, default=10
+        Target score of every match.
+
+    max_rounds : int, default=20
+        Maximum rounds of every match.
+
+    host : str, default='127.0.0.1'
+        Address to listen on.
+
+    port : int, default=0
+        Port to listen on. 0 picks a free port, see ``address``.
+
+    heartbeat_timeout : float, default=5.0
+        Seconds without a message after which a worker is dead.
+
+    prefetch : int, default=2
+        Number of unassigned batches moved to a worker's queue at once.
+    """
+
+    def __init__(
+            self,
+            n_matches=100,
+            seed=0,
+            batch_size=10,
+            target_score=10,
+            max_rounds=20,
+            host='127.0.0.1',
+            port=0,
+            heartbeat_timeout=5.0,
+            prefetch=2):
+        self.n_matches = n_matches
+        self.seed = seed
+        self.batch_size = batch_size
+        self.target_score = target_score
+        self.max_rounds = max_rounds
+        self.host = host
+        self.port = port
+        self.heartbeat_timeout = heartbeat_timeout
+        self.prefetch = prefetch
+
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._closed = threading.Event()
+        self._server = None
+        self._threads = []
+        self._worker_ids = itertools.count()
+        self._batches = []
+        self._unassigned = deque()
+        self._queues = {}
+        self._in_flight = {}
+        self._last_seen = {}
+        self._conns = {}
+        self._results = {}
+
+    def _check_params(self):
+        # n_matches
+        if not isinstance(self.n_matches, int) or self.n_matches < 0:
+            raise ValueError(f"n_matches must be non-negative integer, "
+                             f"got {self.n_matches} instead.")
+
+        # seed
+        if not isinstance(self.seed, int) or isinstance(self.seed, bool):
+            warnings.warn(
+                "seed must be integer; "
+                f"got {self.seed} instead.",
+                RuntimeWarning,
+            )
+            # Default seed set to 0
+            self.seed = 0
+
+        # batch_size
+        if not isinstance(self.batch_size, int) or self.batch_size <= 0:
+            warnings.warn(
+                "batch_size must be positive integer; "
+                f"got {self.batch_size} instead.",
+                RuntimeWarning,
+            )
+            # Default batch_size set to 10
+            self.batch_size = 10
+
+        # prefetch
+        if not isinstance(self.prefetch, int) or self.prefetch <= 0:
+            warnings.warn(
+                "prefetch must be positive integer; "
+                f"got {self.prefetch} instead.",
+                RuntimeWarning,
+            )
+            # Default prefetch set to 2
+            self.prefetch = 2
+
+        # heartbeat_timeout
+        if not isinstance(self.heartbeat_timeout, (int, float)) or \
+                self.heartbeat_timeout <= 0:
+            warnings.warn(
+                "heartbeat_timeout must be positive number; "
+                f"got {self.heartbeat_timeout} instead.",
+                RuntimeWarning,
+            )
+            # Default heartbeat_timeout set to 5.0
+            self.heartbeat_timeout = 5.0
+
+    @property
+    def address(self):
+        """Address ``(host, port)`` the coordinator listens on."""
+        return self._server.getsockname()[:2]
+
+    def start(self):
+        """Split the matches into batches and start accepting workers.
+
+        Returns
+        -------
+        address : tuple
+            Address ``(host, port)`` the coordinator listens on.
+        """
+        self._check_params()
+
+        specs = make_specs(self.n_matches, self.seed,
+                           self.target_score, self.max_rounds)
+        self._batches = [specs[i:i + self.batch_size]
+                         for i in range(0, len(specs), self.batch_size)]
+        self._unassigned = deque(range(len(self._batches)))
+        if not self._batches:
+            self._done.set()
+
+        self._server = socket.create_server((self.host, self.port))
+        for target in (self._accept, self._monitor):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self.address
+
+    def join(self, timeout=None):
+        """Wait until every batch has a result.
+
+        Returns
+        -------
+        results : list of dict
+            Results of all matches ordered by match index.
+
+        Raises
+        ------
+        TimeoutError
+            If the batches are not finished within ``timeout`` seconds.
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"{len(self._results)} of "
+                               f"{len(self._batches)} batches finished.")
+        with self._lock:
+            return [result for batch in sorted(self._results)
+                    for result in self._results[batch]]
+
+    def run(self, timeout=None):
+        """Start, wait for all results and close the coordinator."""
+        self.start()
+        try:
+            return self.join(timeout)
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop accepting workers and close every connection."""
+        self._closed.set()
+        if self._server is not None:
+            self._server.close()
+        with self._lock:
+            for worker in list(self._conns):
+                self._drop(worker)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _accept(self):
+        while not self._closed.is_set():
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                break
+            thread = threading.Thread(target=self._serve, args=(conn,),
+                                      daemon=True)
+            thread.start()
+
+    def _monitor(self):
+        interval = self.heartbeat_timeout / 4
+        while not self._closed.wait(interval):
+            now = time.monotonic()
+            with self._lock:
+                for worker, last_seen in list(self._last_seen.items()):
+                    if now - last_seen > self.heartbeat_timeout:
+                        self._drop(worker)
+
+    def _serve(self, conn):
+        stream = conn.makefile('rb')
+        with self._lock:
+            worker = next(self._worker_ids)
+            self._conns[worker] = conn
+            self._queues[worker] = deque()
+            self._in_flight[worker] = set()
+            self._last_seen[worker] = time.monotonic()
+        try:
+            while True:
+                message = _recv(stream, ('hello', 'heartbeat',
+                                         'request', 'result'))
+                with self._lock:
+                    if worker not in self._conns:
+                        break
+                    self._last_seen[worker] = time.monotonic()
+                    reply = self._handle(worker, message)
+                if reply is not None:
+                    _send(conn, reply)
+        except (OSError, ValueError):
+            # Disconnected worker or protocol error
+            pass
+        finally:
+            with self._lock:
+                self._drop(worker)
+            stream.close()
+
+    def _handle(self, worker, message):
+        kind = message['type']
+        if kind == 'request':
+            if self._done.is_set():
+                return {'type': 'done'}
+            batch = self._next_batch(worker)
+            if batch is None:
+                return {'type': 'wait',
+                        'delay': self.heartbeat_timeout / 10}
+            self._in_flight[worker].add(batch)
+            return {'type': 'batch', 'batch': batch,
+                    'specs': self._batches[batch]}
+        elif kind == 'result':
+            batch = message['batch']
+            # Only accept batches handed to this worker and not yet
+            # re-queued, anything else is dropped
+            if batch not in self._in_flight[worker]:
+                return None
+            self._check_results(batch, message['results'])
+            self._in_flight[worker].remove(batch)
+            self._results.setdefault(batch, message['results'])
+            if len(self._results) == len(self._batches):
+                self._done.set()
+        return None
+
+    def _check_results(self, batch, results):
+        """Check results answer every match of a batch.
+
+        Raises
+        ------
+        ValueError
+            If the results do not match the batch's specifications.
+        """
+        specs = self._batches[batch]
+        if len(results) != len(specs):
+            raise ValueError(f"batch {batch} has {len(specs)} matches, "
+                             f"got {len(results)} results instead.")
+        for spec, result in zip(specs, results):
+            if result.get('index') != spec['index'] or \
+                    result.get('winner') not in _WINNERS or not all(
+                        isinstance(result.get(field), int) and
+                        not isinstance(result[field], bool)
+                        for field in _RESULT_FIELDS):
+                raise ValueError(f"malformed result {result!r} for match "
+                                 f"{spec['index']}.")
+
+    def _next_batch(self, worker):
+        queue = self._queues[worker]
+        if not queue:
+            for _ in range(min(self.prefetch, len(self._unassigned))):
+                queue.append(self._unassigned.popleft())
+        if not queue:
+            # Steal half of the longest queue, starting from its tail
+            victim = max(self._queues.values(), key=len)
+            for _ in range((len(victim) + 1) // 2):
+                queue.append(victim.pop())
+        while queue:
+            batch = queue.popleft()
+            if batch not in self._results:
+                return batch
+        return None
+
+    def _drop(self, worker):
+        """Forget a worker and re-queue its batches.
+
+        Must be called with ``_lock`` held.
+        """
+        conn = self._conns.pop(worker, None)
+        if conn is None:
+            return
+        pending = list(self._in_flight.pop(worker)) + \
+            list(self._queues.pop(worker))
+        del self._last_seen[worker]
+        self._unassigned.extendleft(
+            batch for batch in reversed(pending)
+            if batch not in self._results)
+        try:
+            conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        conn.close()
+
+
+class Worker(ListInstanceMixin):
+    """Worker playing match batches for a remote coordinator.
+
+    Parameters
+    ----------
+    host : str, default='127.0.0.1'
+        Address of the coordinator.
+
+    port : int, default=5555
+        Port of the coordinator.
+
+    heartbeat_interval : float, default=1.0
+        Seconds between two heartbeats. Should be well below the
+        coordinator's ``heartbeat_timeout``.
+    """
+
+    def __init__(self, host='127.0.0.1', port=5555, heartbeat_interval=1.0):
+        self.host = host
+        self.port = port
+        self.heartbeat_interval = heartbeat_interval
+
+        self._send_lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def _check_params(self):
+        # heartbeat_interval
+        if not isinstance(self.heartbeat_interval, (int, float)) or \
+                self.heartbeat_interval <= 0:
+            warnings.warn(
+                "heartbeat_interval must be positive number; "
+                f"got {self.heartbeat_interval} instead.",
+                RuntimeWarning,
+            )
+            # Default heartbeat_interval set to 1.0
+            self.heartbeat_interval = 1.0
+
+    def _send(self, sock, message):
+        with self._send_lock:
+            _send(sock, message)
+
+    def _heartbeat(self, sock):
+        while not self._stopped.wait(self.heartbeat_interval):
+            try:
+                self._send(sock, {'type': 'heartbeat'})
+            except OSError:
+                break
+
+    def run(self):
+        """Play batches until the coordinator is done or unreachable.
+
+        A RuntimeWarning is issued if the coordinator cannot be reached.
+
+        Returns
+        -------
+        n_batches : int
+            Number of batches played by this worker.
+        """
+        self._check_params()
+
+        n_batches = 0
+        self._stopped.clear()
+        try:
+            sock = socket.create_connection((self.host, self.port))
+        except OSError as e:
+            warnings.warn(
+                f"Coordinator {self.host}:{self.port} is unreachable; "
+                f"{e}.",
+                RuntimeWarning,
+            )
+            return n_batches
+        with sock:
+            stream = sock.makefile('rb')
+            heartbeat = threading.Thread(target=self._heartbeat,
+                                         args=(sock,), daemon=True)
+            try:
+                self._send(sock, {'type': 'hello'})
+                heartbeat.start()
+                while True:
+                    self._send(sock, {'type': 'request'})
+                    message = _recv(stream, ('batch', 'wait', 'done'))
+                    if message['type'] == 'done':
+                        break
+                    elif message['type'] == 'wait':
+                        time.sleep(message['delay'])
+                        continue
+                    results = [run_match(spec) for spec in message['specs']]
+                    self._send(sock, {'type': 'result',
+                                      'batch': message['batch'],
+                                      'results': results})
+                    n_batches += 1
+            except (OSError, ValueError):
+                # Coordinator closed the connection or protocol error
+                pass
+            finally:
+                self._stopped.set()
+                stream.close()
+        return n_batches
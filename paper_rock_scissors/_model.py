@@ -0,0 +1,329 @@
+"""Opponent models for paper rock scissors game
+"""
+
+# Author: Yehui He <yehui.he@hotmail.com>
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import json
+import os
+import tempfile
+import threading
+import warnings
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+from ._base import ListInstanceMixin, MoveChoice
+
+
+@contextmanager
+def _file_lock(path):
+    """Hold an exclusive lock on ``path + '.lock'`` across processes."""
+    with open(path + '.lock', 'a+') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class OpponentModel(ListInstanceMixin):
+    """Move frequency and transition counts of one opponent.
+
+    Parameters
+    ----------
+    frequencies : list of int, default=None
+        Number of times each move was played, indexed by
+        ``MoveChoice.value - 1``.
+
+    transitions : list of list of int, default=None
+        ``transitions[i][j]`` counts move ``j`` following move ``i``.
+
+    Attributes
+    ----------
+    last : MoveChoice or None
+        Last observed move. Not persisted.
+    """
+
+    def __init__(self, frequencies=None, transitions=None):
+        n = len(MoveChoice)
+        self.frequencies = list(frequencies) if frequencies \
+            else [0] * n
+        self.transitions = [list(row) for row in transitions] \
+            if transitions else [[0] * n for _ in range(n)]
+        self.last = None
+
+    def __len__(self):
+        return sum(self.frequencies)
+
+    def copy(self):
+        return OpponentModel(self.frequencies, self.transitions)
+
+    def update(self, move):
+        """Record a move of the opponent."""
+        self.frequencies[move.value - 1] += 1
+        if self.last is not None:
+            self.transitions[self.last.value - 1][move.value - 1] += 1
+        self.last = move
+
+    def merge(self, other):
+        """Add the counts of another model to this one."""
+        for i, count in enumerate(other.frequencies):
+            self.frequencies[i] += count
+        for row, other_row in zip(self.transitions, other.transitions):
+            for j, count in enumerate(other_row):
+                row[j] += count
+
+    def predict(self):
+        """Predict the next move of the opponent.
+
+        Uses the transitions from the last move when available and the
+        move frequencies otherwise.
+
+        Returns
+        -------
+        move : MoveChoice or None
+            Most likely next move, None if nothing was observed yet.
+        """
+        counts = self.frequencies
+        if self.last is not None and \
+                any(self.transitions[self.last.value - 1]):
+            counts = self.transitions[self.last.value - 1]
+        if not any(counts):
+            return None
+        return MoveChoice(counts.index(max(counts)) + 1)
+
+    def to_dict(self):
+        return {'frequencies': self.frequencies,
+                'transitions': self.transitions}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a model from the output of ``to_dict``.
+
+        Raises
+        ------
+        ValueError
+            If the counts do not have one entry per move, or a row per
+            move for the transitions, of non-negative integers.
+        """
+        n = len(MoveChoice)
+
+        def is_counts(row):
+            return isinstance(row, list) and len(row) == n and all(
+                isinstance(count, int) and not isinstance(count, bool)
+                and count >= 0 for count in row)
+
+        if not isinstance(data, dict) or \
+                not is_counts(data.get('frequencies')) or \
+                not isinstance(data.get('transitions'), list) or \
+                len(data['transitions']) != n or \
+                not all(is_counts(row) for row in data['transitions']):
+            raise ValueError(f"malformed opponent model {data!r}.")
+        return cls(data['frequencies'], data['transitions'])
+
+
+class OpponentModelStore(ListInstanceMixin):
+    """Persistent LRU store of opponent models keyed by player name.
+
+    Models are kept in memory, so ``get`` is O(1). Sessions commit the
+    counts they observed with ``update``; counts are added rather than
+    overwritten, so concurrent sessions of the same player are all kept.
+    Updates are written back to ``path`` once ``flush_every`` of them
+    are pending, on ``flush`` and on ``close``. Write back holds an
+    exclusive lock on ``path + '.lock'`` and merges the pending counts
+    into the file's current content, so stores of several processes can
+    share one file.
+
+    Parameters
+    ----------
+    path : str or None, default=None
+        JSON file backing the store. If None, the store is in memory only.
+
+    capacity : int, default=128
+        Maximum number of players kept. The least recently used player
+        is evicted first.
+
+    flush_every : int, default=10
+        Number of pending updates which triggers a write back.
+    """
+
+    def __init__(self, path=None, capacity=128, flush_every=10):
+        self.path = path
+        self.capacity = capacity
+        self.flush_every = flush_every
+
+        self._lock = threading.Lock()
+        self._models = OrderedDict()
+        self._deltas = {}
+        # Names read or updated since the last write back, least recent first
+        self._touched = OrderedDict()
+        self._pending = 0
+        self._check_params()
+        self._load()
+
+    def _check_params(self):
+        # capacity
+        if not isinstance(self.capacity, int) or self.capacity <= 0:
+            warnings.warn(
+                "capacity must be positive integer; "
+                f"got {self.capacity} instead.",
+                RuntimeWarning,
+            )
+            # Default capacity set to 128
+            self.capacity = 128
+
+        # flush_every
+        if not isinstance(self.flush_every, int) or self.flush_every <= 0:
+            warnings.warn(
+                "flush_every must be positive integer; "
+                f"got {self.flush_every} instead.",
+                RuntimeWarning,
+            )
+            # Default flush_every set to 10
+            self.flush_every = 10
+
+    def __len__(self):
+        return len(self._models)
+
+    def __contains__(self, name):
+        return name in self._models
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _read(self):
+        models = OrderedDict()
+        if not os.path.exists(self.path):
+            return models
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError(f"expected an object, got {data!r}.")
+            # Stored from least to most recently used
+            for name, model in data.items():
+                models[name] = OpponentModel.from_dict(model)
+        except (OSError, ValueError) as e:
+            warnings.warn(
+                f"Opponent model store {self.path} is corrupt, "
+                f"starting with an empty store; got {e}",
+                RuntimeWarning,
+            )
+            # Default to an empty store
+            models = OrderedDict()
+        return models
+
+    def _load(self):
+        if self.path is None:
+            return
+        self._models = self._read()
+        self._evict()
+
+    def _touch(self, name):
+        self._models.move_to_end(name)
+        self._touched[name] = None
+        self._touched.move_to_end(name)
+
+    def _evict(self):
+        while len(self._models) > self.capacity:
+            self._models.popitem(last=False)
+
+    def get(self, name):
+        """Return a copy of the model of a player.
+
+        Returns
+        -------
+        model : OpponentModel
+            Stored model, or an empty one for a new player.
+        """
+        with self._lock:
+            model = self._models.get(name)
+            if model is None:
+                return OpponentModel()
+            self._touch(name)
+            return model.copy()
+
+    def update(self, name, model):
+        """Add the counts observed during a session to a player's model.
+
+        Parameters
+        ----------
+        name : str
+            Player name.
+
+        model : OpponentModel
+            Counts observed during the session only.
+        """
+        with self._lock:
+            stored = self._models.setdefault(name, OpponentModel())
+            stored.merge(model)
+            self._deltas.setdefault(name, OpponentModel()).merge(model)
+            self._touch(name)
+            self._evict()
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._flush()
+
+    def flush(self):
+        """Write pending updates back to ``path``."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        if self.path is None:
+            self._deltas = {}
+            self._touched.clear()
+            self._pending = 0
+            return
+        with _file_lock(self.path):
+            # Other processes may have written since the last read,
+            # add the pending counts to the file's current content
+            models = self._read()
+            for name, delta in self._deltas.items():
+                models.setdefault(name, OpponentModel()).merge(delta)
+            # Keep the recency of the players used by this store
+            for name in self._touched:
+                if name in models:
+                    models.move_to_end(name)
+            self._models = models
+            self._evict()
+            data = {name: model.to_dict()
+                    for name, model in self._models.items()}
+            # Write to a temporary file first so readers never see a
+            # partial file
+            fd, tmp = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.path)))
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.remove(tmp)
+                raise
+            # Pending counts are only dropped once written back
+            self._deltas = {}
+            self._touched.clear()
+            self._pending = 0
+
+    def close(self):
+        """Flush pending updates."""
+        self.flush()
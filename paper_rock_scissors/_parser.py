@@ -29,6 +29,22 @@ parser.add_argument('-s', '--seed', default=None,
                     help='Computer random number generator seed')
 parser.add_argument('-sp', '--sleep', type=int, default=1,
                     help='Sleep time when computer is making a decision')
+parser.add_argument('--model-store', type=str, default=None,
+                    help='JSON file of opponent models. When set the '
+                         'computer adapts to the player, remembering '
+                         'returning players by name')
+parser.add_argument('--mode', choices=['play', 'coordinator', 'worker'],
+                    default='play',
+                    help='Play interactively, distribute headless matches '
+                         'as coordinator or play them as worker')
+parser.add_argument('--host', type=str, default='127.0.0.1',
+                    help='Coordinator address')
+parser.add_argument('--port', type=int, default=5555,
+                    help='Coordinator port')
+parser.add_argument('--matches', type=int, default=100,
+                    help='Number of headless matches played by the workers')
+parser.add_argument('--batch-size', type=int, default=10,
+                    help='Number of matches sent to a worker at once')
 parser.add_argument('-v', '--verbose', action='count', default=1,
                     help='Verbosity level')
 parser.add_argument('-V', '--version', action='version',
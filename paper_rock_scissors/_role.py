@@ -6,7 +6,8 @@
 import random
 import warnings
 
-from ._base import ListInstanceMixin, BaseRole, MoveChoice
+from ._base import ListInstanceMixin, BaseRole, MoveChoice, GameEnvironment
+from ._model import OpponentModel
 
 
 class Player(ListInstanceMixin, BaseRole):
@@ -86,6 +87,7 @@ class Computer(ListInstanceMixin, BaseRole):
     def __init__(self, name='ai', role='Computer', score=0, *, seed=None):
         super().__init__(role, name, score)
         self.seed = seed
+        self._rng = random.Random(seed)
 
     def _check_params(self):
         super()._check_params()
@@ -99,7 +101,7 @@ class Computer(ListInstanceMixin, BaseRole):
             )
             # Default seed set to None
             self.seed = None
-        random.seed(self.seed)
+        self._rng.seed(self.seed)
 
     def get_move(self, prompt):
         """Randomized AI move
@@ -109,4 +111,72 @@ class Computer(ListInstanceMixin, BaseRole):
         move : MoveChoice
             Random AI move.
         """
-        return MoveChoice(random.randint(1, len(MoveChoice)))
+        return MoveChoice(self._rng.randint(1, len(MoveChoice)))
+
+
+class AdaptiveComputer(Computer):
+    """Computer role countering the predicted move of its opponent.
+
+    The opponent model is loaded from ``store`` by the opponent's name
+    when the game starts, so returning players are countered from the
+    first round. The counts observed during the game are written back
+    to the store when the game ends.
+
+    Parameters
+    ----------
+    name : str, default='ai'
+        Computer's name.
+
+    role : str, default='Computer'
+        Computer's role in the GameEnvironment.
+
+    score : int, default=0
+        Computer's current score of the game.
+
+    seed : int or None, default=None
+        Random number generator's seed. Used while nothing is known
+        about the opponent.
+
+    store : _model.OpponentModelStore or None, default=None
+        Store of opponent models. If None, the opponent is learned
+        from scratch every game.
+    """
+
+    def __init__(self, name='ai', role='Computer', score=0, *, seed=None,
+                 store=None):
+        super().__init__(name, role, score, seed=seed)
+        self.store = store
+        self.opponent = None
+        self.model = OpponentModel()
+        self._session = OpponentModel()
+
+    def start_game(self, opponent):
+        self.opponent = opponent
+        self.model = self.store.get(opponent.name) \
+            if self.store is not None else OpponentModel()
+        self._session = OpponentModel()
+
+    def observe(self, move):
+        self.model.update(move)
+        self._session.update(move)
+
+    def end_game(self):
+        if self.store is not None and self.opponent is not None:
+            self.store.update(self.opponent.name, self._session)
+        self._session = OpponentModel()
+
+    def get_move(self, prompt):
+        """Counter the opponent's most likely move
+
+        Returns
+        -------
+        move : MoveChoice
+            Move beating the predicted move, random if there is
+            no prediction.
+        """
+        predicted = self.model.predict()
+        if predicted is None:
+            return super().get_move(prompt)
+        for move, beaten in GameEnvironment._ROLES_MAPPING.items():
+            if predicted in beaten:
+                return move
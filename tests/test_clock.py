@@ -0,0 +1,123 @@
+import asyncio
+import unittest
+
+from paper_rock_scissors import SystemClock, VirtualClock, AsyncVirtualClock
+
+
+class SystemClockTestCase(unittest.TestCase):
+    def test_time_is_monotonic(self):
+        clock = SystemClock()
+        start = clock.time()
+        clock.sleep(0)
+        self.assertGreaterEqual(clock.time(), start)
+
+
+class VirtualClockTestCase(unittest.TestCase):
+    def test_sleep_advances_time(self):
+        clock = VirtualClock(start=5)
+        clock.sleep(1)
+        clock.sleep(2.5)
+        self.assertEqual(clock.time(), 8.5)
+        self.assertEqual(clock.durations, [1, 2.5])
+        self.assertEqual(clock.elapsed, 3.5)
+
+    def test_negative_sleep(self):
+        clock = VirtualClock()
+        with self.assertRaises(ValueError):
+            clock.sleep(-1)
+        self.assertEqual(clock.time(), 0)
+
+
+class AsyncVirtualClockTestCase(unittest.TestCase):
+    def test_concurrent_sleeps_overlap(self):
+        clock = AsyncVirtualClock()
+
+        async def run():
+            await asyncio.gather(clock.asleep(1), clock.asleep(2))
+
+        asyncio.run(run())
+        self.assertEqual(clock.time(), 2)
+        self.assertEqual(sorted(clock.durations), [1, 2])
+
+    def test_wake_in_deadline_order(self):
+        clock = AsyncVirtualClock()
+        woken = []
+
+        async def task(seconds):
+            await clock.asleep(seconds)
+            woken.append((seconds, clock.time()))
+
+        async def run():
+            await asyncio.gather(task(5), task(1), task(3))
+
+        asyncio.run(run())
+        self.assertEqual(woken, [(1, 1), (3, 3), (5, 5)])
+
+    def test_chained_sleeps(self):
+        clock = AsyncVirtualClock()
+        woken = []
+
+        async def task(name, seconds):
+            for _ in range(2):
+                await clock.asleep(seconds)
+                woken.append((name, clock.time()))
+
+        async def run():
+            await asyncio.gather(task('a', 3), task('b', 2))
+
+        asyncio.run(run())
+        self.assertEqual(woken, [('b', 2), ('a', 3), ('b', 4), ('a', 6)])
+
+    def test_interleaved_await(self):
+        clock = AsyncVirtualClock()
+        woken = []
+
+        async def task_a():
+            await clock.asleep(1)
+            await asyncio.sleep(0)
+            await clock.asleep(1)
+            woken.append(('a', clock.time()))
+
+        async def task_b():
+            await clock.asleep(5)
+            woken.append(('b', clock.time()))
+
+        async def run():
+            await asyncio.gather(task_a(), task_b())
+
+        asyncio.run(run())
+        self.assertEqual(woken, [('a', 2), ('b', 5)])
+
+    def test_queue_handoff(self):
+        clock = AsyncVirtualClock()
+        woken = []
+
+        async def run():
+            queue = asyncio.Queue()
+
+            async def producer():
+                await clock.asleep(1)
+                await queue.put('move')
+
+            async def consumer():
+                await queue.get()
+                await clock.asleep(1)
+                woken.append(('consumer', clock.time()))
+
+            async def idle():
+                await clock.asleep(10)
+                woken.append(('idle', clock.time()))
+
+            await asyncio.gather(producer(), consumer(), idle())
+
+        asyncio.run(run())
+        self.assertEqual(woken, [('consumer', 2), ('idle', 10)])
+
+    def test_negative_asleep(self):
+        clock = AsyncVirtualClock()
+        with self.assertRaises(ValueError):
+            asyncio.run(clock.asleep(-1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+from collections import deque
+import json
+import socket
+import threading
+import unittest
+
+from paper_rock_scissors import Coordinator, Worker, run_local
+
+
+class WorkerTestCase(unittest.TestCase):
+    def test_invalid_heartbeat_interval(self):
+        worker = Worker(heartbeat_interval=-1)
+        with self.assertWarns(RuntimeWarning):
+            worker._check_params()
+        self.assertEqual(worker.heartbeat_interval, 1.0)
+
+    def test_unreachable_coordinator(self):
+        # Reserve a free port and close it so nothing listens there
+        with socket.create_server(('127.0.0.1', 0)) as server:
+            port = server.getsockname()[1]
+        worker = Worker(port=port)
+        with self.assertWarns(RuntimeWarning):
+            self.assertEqual(worker.run(), 0)
+
+
+class CoordinatorTestCase(unittest.TestCase):
+    def _start_workers(self, address, n_workers):
+        host, port = address
+        workers = []
+        for _ in range(n_workers):
+            worker = Worker(host=host, port=port, heartbeat_interval=0.05)
+            thread = threading.Thread(target=worker.run, daemon=True)
+            thread.start()
+            workers.append(thread)
+        return workers
+
+    def test_matches_local_results(self):
+        expected = run_local(n_matches=37, seed=7,
+                             target_score=3, max_rounds=5)
+        with Coordinator(n_matches=37, seed=7, batch_size=4,
+                         target_score=3, max_rounds=5,
+                         heartbeat_timeout=1.0) as coordinator:
+            self._start_workers(coordinator.address, 3)
+            results = coordinator.join(timeout=10)
+        self.assertEqual(results, expected)
+        self.assertEqual([r['index'] for r in results], list(range(37)))
+
+    def test_no_matches(self):
+        with Coordinator(n_matches=0) as coordinator:
+            self.assertEqual(coordinator.join(timeout=1), [])
+
+    def test_invalid_seed(self):
+        coordinator = Coordinator(seed='no')
+        with self.assertWarns(RuntimeWarning):
+            coordinator._check_params()
+        self.assertEqual(coordinator.seed, 0)
+
+    def test_invalid_batch_size(self):
+        coordinator = Coordinator(batch_size=0)
+        with self.assertWarns(RuntimeWarning):
+            coordinator._check_params()
+        self.assertEqual(coordinator.batch_size, 10)
+
+    def test_invalid_heartbeat_timeout(self):
+        coordinator = Coordinator(heartbeat_timeout=0)
+        with self.assertWarns(RuntimeWarning):
+            coordinator._check_params()
+        self.assertEqual(coordinator.heartbeat_timeout, 5.0)
+
+    def test_requeue_disconnected_worker(self):
+        expected = run_local(n_matches=10, seed=1)
+        with Coordinator(n_matches=10, seed=1, batch_size=2,
+                         heartbeat_timeout=1.0) as coordinator:
+            # Take a batch and disconnect without a result
+            with socket.create_connection(coordinator.address) as sock:
+                sock.sendall(b'{"type": "request"}\n')
+                reply = json.loads(sock.makefile('rb').readline())
+            self.assertEqual(reply['type'], 'batch')
+            self._start_workers(coordinator.address, 2)
+            results = coordinator.join(timeout=10)
+        self.assertEqual(results, expected)
+
+    def test_requeue_silent_worker(self):
+        expected = run_local(n_matches=10, seed=2)
+        with Coordinator(n_matches=10, seed=2, batch_size=2,
+                         heartbeat_timeout=0.2) as coordinator:
+            # Take a batch and stop sending heartbeats
+            sock = socket.create_connection(coordinator.address)
+            sock.sendall(b'{"type": "request"}\n')
+            reply = json.loads(sock.makefile('rb').readline())
+            self.assertEqual(reply['type'], 'batch')
+            self._start_workers(coordinator.address, 2)
+            results = coordinator.join(timeout=10)
+            sock.close()
+        self.assertEqual(results, expected)
+
+    def test_ignore_unassigned_result(self):
+        expected = run_local(n_matches=4, seed=0)
+        with Coordinator(n_matches=4, seed=0, batch_size=2,
+                         heartbeat_timeout=1.0) as coordinator:
+            with socket.create_connection(coordinator.address) as sock:
+                for batch in (7, 9, 0, 1):
+                    sock.sendall(json.dumps({'type': 'result',
+                                             'batch': batch,
+                                             'results': []}).encode() + b'\n')
+                with self.assertRaises(TimeoutError):
+                    coordinator.join(timeout=0.2)
+            self._start_workers(coordinator.address, 1)
+            results = coordinator.join(timeout=10)
+        self.assertEqual(results, expected)
+
+    def test_drop_malformed_message(self):
+        expected = run_local(n_matches=4, seed=0)
+        messages = [b'{"type": "result"}\n',
+                    b'[1, 2]\n',
+                    b'{"type": "result", "batch": "0", "results": []}\n',
+                    b'{"type": "batch", "batch": 0, "specs": []}\n',
+                    b'not json\n']
+        with Coordinator(n_matches=4, seed=0, batch_size=2,
+                         heartbeat_timeout=1.0) as coordinator:
+            for message in messages:
+                with socket.create_connection(coordinator.address) as sock:
+                    sock.sendall(b'{"type": "request"}\n')
+                    stream = sock.makefile('rb')
+                    self.assertEqual(json.loads(stream.readline())['type'],
+                                     'batch')
+                    sock.sendall(message)
+                    # The coordinator closes the connection
+                    self.assertEqual(stream.readline(), b'')
+            self._start_workers(coordinator.address, 1)
+            results = coordinator.join(timeout=10)
+        self.assertEqual(results, expected)
+
+    def test_drop_mismatched_results(self):
+        expected = run_local(n_matches=4, seed=0)
+        with Coordinator(n_matches=4, seed=0, batch_size=2,
+                         heartbeat_timeout=1.0) as coordinator:
+            with socket.create_connection(coordinator.address) as sock:
+                stream = sock.makefile('rb')
+                sock.sendall(b'{"type": "request"}\n')
+                reply = json.loads(stream.readline())
+                self.assertEqual(reply['type'], 'batch')
+                sock.sendall(json.dumps({'type': 'result',
+                                         'batch': reply['batch'],
+                                         'results': [{'bogus': 1}]}).encode()
+                             + b'\n')
+                # The coordinator closes the connection
+                self.assertEqual(stream.readline(), b'')
+            with socket.create_connection(coordinator.address) as sock:
+                stream = sock.makefile('rb')
+                sock.sendall(b'{"type": "request"}\n')
+                reply = json.loads(stream.readline())
+                # Shuffled results of the right length are rejected too
+                results = [run_local(4, 0)[spec['index']]
+                           for spec in reply['specs']][::-1]
+                sock.sendall(json.dumps({'type': 'result',
+                                         'batch': reply['batch'],
+                                         'results': results}).encode()
+                             + b'\n')
+                self.assertEqual(stream.readline(), b'')
+            self._start_workers(coordinator.address, 1)
+            results = coordinator.join(timeout=10)
+        self.assertEqual(results, expected)
+
+    def test_work_stealing(self):
+        coordinator = Coordinator(prefetch=4)
+        coordinator._batches = [[]] * 4
+        coordinator._unassigned.extend(range(4))
+        coordinator._queues = {0: deque(), 1: deque()}
+        self.assertEqual(coordinator._next_batch(0), 0)
+        # Worker 1 steals the tail half of worker 0's queue
+        self.assertEqual(coordinator._next_batch(1), 3)
+        self.assertEqual(list(coordinator._queues[0]), [1])
+        self.assertEqual(list(coordinator._queues[1]), [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
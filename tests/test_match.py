@@ -3,6 +3,7 @@ import unittest
 from unittest.mock import patch
 
 from paper_rock_scissors import GameEnvironment, Player, Computer, MoveChoice, Outcome
+from paper_rock_scissors import SystemClock, VirtualClock
 
 
 class GameEnvironmentTestCase(unittest.TestCase):
@@ -87,6 +88,27 @@ class GameEnvironmentTestCase(unittest.TestCase):
         GameEnvironment.play()
         self.assertEqual(GameEnvironment.winner, computer)
 
+    def test_invalid_clock(self):
+        env = GameEnvironment(self.player, self.computer, clock='no')
+        with self.assertWarns(RuntimeWarning):
+            env._check_params()
+        self.assertIsInstance(env.clock, SystemClock)
+
+    @patch('builtins.input', side_effect=[1, 2, 1, 3, 2, 3, 1, 2, 1, 1, 3, 2, 3, 2, 2, 3, 3, 1, 2, 1, 3, 1])
+    def test_virtual_clock_play(self, input):
+        computer = Computer(seed=0)
+        clock = VirtualClock()
+        env = GameEnvironment(self.player,
+                              computer,
+                              target_score=10,
+                              max_rounds=10,
+                              sleep=1,
+                              verbose=0,
+                              clock=clock)
+        env.play()
+        self.assertEqual(clock.durations, [1] * env.curr_round)
+        self.assertEqual(clock.time(), env.curr_round)
+
     # TODO: more tests
 
 
@@ -0,0 +1,193 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from paper_rock_scissors import MoveChoice, OpponentModel, OpponentModelStore
+
+
+class OpponentModelTestCase(unittest.TestCase):
+    def test_empty_predict(self):
+        self.assertIsNone(OpponentModel().predict())
+
+    def test_predict_transition(self):
+        model = OpponentModel()
+        for move in [1, 2, 1, 2, 1, 3, 3, 3]:
+            model.update(MoveChoice(move))
+        # ROCK is played most often, but PAPER follows it
+        model.last = MoveChoice(1)
+        self.assertEqual(model.predict(), MoveChoice(2))
+        # Nothing followed SCISSORS twice yet, fall back to frequencies
+        model.last = MoveChoice(2)
+        self.assertEqual(model.predict(), MoveChoice(1))
+
+    def test_merge(self):
+        model = OpponentModel()
+        model.update(MoveChoice(1))
+        model.update(MoveChoice(2))
+        merged = OpponentModel()
+        merged.merge(model)
+        merged.merge(model)
+        self.assertEqual(merged.frequencies, [2, 2, 0])
+        self.assertEqual(merged.transitions[0], [0, 2, 0])
+
+    def test_malformed_from_dict(self):
+        for data in [{'frequencies': [1, 2], 'transitions': []},
+                     {'frequencies': [1, 2, 3]},
+                     {'frequencies': [1, 2, -3],
+                      'transitions': [[0] * 3] * 3},
+                     {'frequencies': [1, 2, 3],
+                      'transitions': [[0] * 3, [0] * 3, [0, 'a', 0]]},
+                     [1, 2, 3]]:
+            with self.assertRaises(ValueError):
+                OpponentModel.from_dict(data)
+
+
+class OpponentModelStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'models.json')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _model(self, *moves):
+        model = OpponentModel()
+        for move in moves:
+            model.update(MoveChoice(move))
+        return model
+
+    def test_invalid_capacity(self):
+        with self.assertWarns(RuntimeWarning):
+            store = OpponentModelStore(capacity=0)
+        self.assertEqual(store.capacity, 128)
+
+    def test_unknown_player(self):
+        store = OpponentModelStore()
+        self.assertEqual(len(store.get('nobody')), 0)
+        self.assertNotIn('nobody', store)
+
+    def test_lru_eviction(self):
+        store = OpponentModelStore(capacity=2)
+        store.update('a', self._model(1))
+        store.update('b', self._model(2))
+        store.get('a')
+        store.update('c', self._model(3))
+        self.assertIn('a', store)
+        self.assertNotIn('b', store)
+        self.assertIn('c', store)
+
+    def test_lru_eviction_with_file(self):
+        store = OpponentModelStore(self.path, capacity=2, flush_every=1)
+        store.update('a', self._model(1))
+        store.update('b', self._model(2))
+        store.get('a')
+        store.update('c', self._model(3))
+        self.assertIn('a', store)
+        self.assertNotIn('b', store)
+        self.assertIn('c', store)
+
+        store = OpponentModelStore(self.path, capacity=2)
+        self.assertIn('a', store)
+        self.assertNotIn('b', store)
+        self.assertIn('c', store)
+
+    def test_corrupt_file(self):
+        for content in ['not json',
+                        '[1, 2]',
+                        '{"x": {"frequencies": [1, 2], "transitions": []}}']:
+            with open(self.path, 'w') as f:
+                f.write(content)
+            with self.assertWarns(RuntimeWarning):
+                store = OpponentModelStore(self.path)
+            self.assertEqual(len(store), 0)
+            store.update('x', self._model(1))
+            with self.assertWarns(RuntimeWarning):
+                store.close()
+            self.assertEqual(
+                OpponentModelStore(self.path).get('x').frequencies, [1, 0, 0])
+
+    def test_batched_write_back(self):
+        store = OpponentModelStore(self.path, flush_every=2)
+        store.update('a', self._model(1))
+        self.assertFalse(os.path.exists(self.path))
+        store.update('a', self._model(2))
+        self.assertTrue(os.path.exists(self.path))
+        store.update('b', self._model(3))
+        store.close()
+
+        store = OpponentModelStore(self.path)
+        self.assertEqual(store.get('a').frequencies, [1, 1, 0])
+        self.assertEqual(store.get('b').frequencies, [0, 0, 1])
+
+    def test_failed_write_back(self):
+        store = OpponentModelStore(self.path)
+        store.update('a', self._model(1))
+        with patch('json.dump', side_effect=OSError):
+            with self.assertRaises(OSError):
+                store.flush()
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)),
+                         ['models.json.lock'])
+        # The pending counts are written back by the next flush
+        store.flush()
+        self.assertEqual(OpponentModelStore(self.path).get('a').frequencies,
+                         [1, 0, 0])
+
+    def test_concurrent_sessions(self):
+        store = OpponentModelStore(self.path, flush_every=7)
+
+        def session():
+            for _ in range(50):
+                store.update('player', self._model(1, 2))
+
+        threads = [threading.Thread(target=session) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        store.close()
+
+        model = OpponentModelStore(self.path).get('player')
+        self.assertEqual(model.frequencies, [200, 200, 0])
+        self.assertEqual(model.transitions[0], [0, 200, 0])
+
+    def test_stores_share_file(self):
+        first = OpponentModelStore(self.path)
+        second = OpponentModelStore(self.path)
+        first.update('player', self._model(1))
+        second.update('player', self._model(1))
+        second.update('other', self._model(2))
+        first.close()
+        second.close()
+
+        store = OpponentModelStore(self.path)
+        self.assertEqual(store.get('player').frequencies, [2, 0, 0])
+        self.assertEqual(store.get('other').frequencies, [0, 1, 0])
+        # The last store to write back also sees the other's counts
+        self.assertEqual(second.get('player').frequencies, [2, 0, 0])
+
+    def test_processes_share_file(self):
+        script = ("import sys\n"
+                  "from paper_rock_scissors import MoveChoice, "
+                  "OpponentModel, OpponentModelStore\n"
+                  "store = OpponentModelStore(sys.argv[1], flush_every=1)\n"
+                  "for _ in range(20):\n"
+                  "    model = OpponentModel()\n"
+                  "    model.update(MoveChoice.ROCK)\n"
+                  "    store.update('player', model)\n")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        processes = [subprocess.Popen([sys.executable, '-c', script,
+                                       self.path], cwd=root)
+                     for _ in range(4)]
+        for process in processes:
+            self.assertEqual(process.wait(timeout=60), 0)
+
+        store = OpponentModelStore(self.path)
+        self.assertEqual(store.get('player').frequencies, [80, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
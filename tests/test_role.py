@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch
 
 from paper_rock_scissors import Player, Computer, MoveChoice
+from paper_rock_scissors import AdaptiveComputer, GameEnvironment, OpponentModelStore
 
 
 class PlayerTestCase(unittest.TestCase):
@@ -52,5 +53,40 @@ class ComputerTestCase(unittest.TestCase):
         self.assertEqual(computer.get_move(), MoveChoice(3))
 
 
+class AdaptiveComputerTestCase(unittest.TestCase):
+    def test_counter_predicted_move(self):
+        computer = AdaptiveComputer(seed=0)
+        computer.start_game(Player())
+        for _ in range(3):
+            computer.observe(MoveChoice.ROCK)
+        self.assertEqual(computer.get_move("Choose a move for this round: "),
+                         MoveChoice.PAPER)
+
+    @patch('builtins.input', return_value=1)
+    def test_warm_start(self, input):
+        store = OpponentModelStore()
+        computer = AdaptiveComputer(seed=0, store=store)
+        env = GameEnvironment(Player(name='Yehui'), computer,
+                              target_score=5, max_rounds=5, verbose=0)
+        env.simulate()
+        self.assertEqual(store.get('Yehui').frequencies[0], env.curr_round)
+
+        # A new game counters the returning player from the first round
+        computer = AdaptiveComputer(seed=0, store=store)
+        computer.start_game(Player(name='Yehui'))
+        self.assertEqual(computer.get_move("Choose a move for this round: "),
+                         MoveChoice.PAPER)
+
+    @patch('builtins.input', side_effect=[1, 1, KeyboardInterrupt])
+    def test_interrupted_game_commits(self, input):
+        store = OpponentModelStore()
+        computer = AdaptiveComputer(seed=0, store=store)
+        env = GameEnvironment(Player(name='Yehui'), computer,
+                              sleep=0, verbose=0)
+        with self.assertRaises(KeyboardInterrupt):
+            env.play()
+        self.assertEqual(store.get('Yehui').frequencies, [2, 0, 0])
+
+
 if __name__ == '__main__':
     unittest.main()